@@ -1,11 +1,49 @@
+import itertools
 import json
+import re
 import uuid
+from collections import defaultdict
 from typing import Any, Dict, List, Optional, Union
 
-from .formatters import _repr_granule_html
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Matches S3 links as-is, and HTTPS links to cumulus/protected buckets capturing the
+# bucket path so the S3 link can be derived from it.
+_S3_LINK = re.compile(
+    r"s3|https://(?=.*(?:cumulus|protected)).*?nasa\.gov/(?P<path>.*)"
+)
+
+# `CustomDict.uuid` is only an opaque per-result identifier, so a random
+# per-process prefix plus a counter is enough and cheaper than a uuid4 per result.
+_UID_PREFIX = uuid.uuid4().hex[:8]
+_uid_counter = itertools.count()
+
+
+def _next_uid() -> str:
+    return f"{_UID_PREFIX}-{next(_uid_counter):x}"
+
+
+def _dumps(obj: Any) -> str:
+    """Pretty-prints a result as JSON, using orjson when it is installed.
+
+    orjson comes with the `orjson` extra. Its output is the same JSON document,
+    but non-ASCII characters are written as-is instead of escaped, and some
+    numbers are formatted differently (e.g. `1e16` instead of `1e+16`).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, sort_keys=False, indent=2, separators=(",", ": "))
 
 
 class CustomDict(dict):
+    __slots__ = ("cloud_hosted", "uuid", "_links_by_type", "_fields", "_render_dict")
+
     _basic_umm_fields_: List = []
     _basic_meta_fields_: List = []
 
@@ -17,45 +55,53 @@ class CustomDict(dict):
     ):
         super().__init__(collection)
         self.cloud_hosted = cloud_hosted
-        self.uuid = str(uuid.uuid4())
+        self.uuid = _next_uid()
+        self._links_by_type: Optional[Dict[str, List[str]]] = None
+        self._fields = fields
+        self._render_dict: Any = None
 
-        self.render_dict: Any
-        if fields is None:
-            self.render_dict = self
-        elif fields[0] == "basic":
-            self.render_dict = self._filter_fields_(self._basic_umm_fields_)
-        else:
-            self.render_dict = self._filter_fields_(fields)
+    @property
+    def render_dict(self) -> Any:
+        """The fields shown when the result is displayed.
+
+        The projection is built on first access, since most results are consumed
+        programmatically and never displayed.
+        """
+        if self._render_dict is None:
+            if self._fields is None:
+                self._render_dict = self
+            elif self._fields[0] == "basic":
+                self._render_dict = self._filter_fields_(self._basic_umm_fields_)
+            else:
+                self._render_dict = self._filter_fields_(self._fields)
+        return self._render_dict
 
     def _filter_fields_(self, fields: List[str]) -> Dict[str, Any]:
-        filtered_dict = {
-            "umm": dict(
-                (field, self["umm"][field]) for field in fields if field in self["umm"]
-            )
+        meta, umm = self["meta"], self["umm"]
+        return {
+            "meta": {f: meta[f] for f in self._basic_meta_fields_ if f in meta},
+            "umm": {f: umm[f] for f in fields if f in umm},
         }
-        basic_dict = {
-            "meta": dict(
-                (field, self["meta"][field])
-                for field in self._basic_meta_fields_
-                if field in self["meta"]
-            )
-        }
-        basic_dict.update(filtered_dict)
-        return basic_dict
 
     def _filter_related_links(self, filter: str) -> List[str]:
-        """Filter RelatedUrls from the UMM fields on CMR."""
-        matched_links: List = []
-        if "RelatedUrls" in self["umm"]:
-            for link in self["umm"]["RelatedUrls"]:
-                if link["Type"] == filter:
-                    matched_links.append(link["URL"])
-        return matched_links
+        """Filter RelatedUrls from the UMM fields on CMR.
+
+        The RelatedUrls are bucketed by type on the first call, so later calls
+        (e.g. `data_links` followed by `dataviz_links`) don't rescan the list.
+        """
+        if self._links_by_type is None:
+            links_by_type: Dict[str, List[str]] = defaultdict(list)
+            for link in self.get("umm", {}).get("RelatedUrls", ()):
+                links_by_type[link["Type"]].append(link["URL"])
+            self._links_by_type = links_by_type
+        return list(self._links_by_type.get(filter, []))
 
 
 class DataCollection(CustomDict):
     """Dictionary-like object to represent a data collection from CMR."""
 
+    __slots__ = ()
+
     _basic_meta_fields_ = [
         "concept-id",
         "granule-count",
@@ -81,16 +127,18 @@ class DataCollection(CustomDict):
         """
         # we can print only the concept-id
 
+        umm = self["umm"]
         summary_dict: Dict[str, Any]
         summary_dict = {
-            "short-name": self.get_umm("ShortName"),
-            "concept-id": self.concept_id(),
-            "version": self.version(),
+            "short-name": umm.get("ShortName", ""),
+            "concept-id": self["meta"]["concept-id"],
+            "version": umm.get("Version", ""),
             "file-type": self.data_type(),
             "get-data": self.get_data(),
         }
-        if "Region" in self.s3_bucket():
-            summary_dict["cloud-info"] = self.s3_bucket()
+        s3_bucket = umm.get("DirectDistributionInformation", {})
+        if "Region" in s3_bucket:
+            summary_dict["cloud-info"] = s3_bucket
         return summary_dict
 
     def get_umm(self, umm_field: str) -> Union[str, Dict[str, Any]]:
@@ -173,14 +221,14 @@ class DataCollection(CustomDict):
         return {}
 
     def __repr__(self) -> str:
-        return json.dumps(
-            self.render_dict, sort_keys=False, indent=2, separators=(",", ": ")
-        )
+        return _dumps(self.render_dict)
 
 
 class DataGranule(CustomDict):
     """Dictionary-like object to represent a granule from CMR."""
 
+    __slots__ = ("_size_mb",)
+
     _basic_meta_fields_ = [
         "concept-id",
         "provider-id",
@@ -200,39 +248,34 @@ class DataGranule(CustomDict):
         fields: Optional[List[str]] = None,
         cloud_hosted: bool = False,
     ):
-        super().__init__(collection)
-        self.cloud_hosted = cloud_hosted
+        super().__init__(collection, fields, cloud_hosted)
         # TODO: maybe add area, start date and all that as an instance value
+        self._size_mb: Optional[float] = None
         self["size"] = self.size()
-        self.uuid = str(uuid.uuid4())
-        self.render_dict: Any
-        if fields is None:
-            self.render_dict = self
-        elif fields[0] == "basic":
-            self.render_dict = self._filter_fields_(self._basic_umm_fields_)
-        else:
-            self.render_dict = self._filter_fields_(fields)
 
     def __repr__(self) -> str:
         """
         Returns:
             A basic representation of a data granule.
         """
-        data_links = [link for link in self.data_links()]
-        rep_str = f"""
-        Collection: {self['umm']['CollectionReference']}
-        Spatial coverage: {self['umm']['SpatialExtent']}
-        Temporal coverage: {self['umm']['TemporalExtent']}
-        Size(MB): {self.size()}
-        Data: {data_links}\n\n
-        """.strip().replace("  ", "")
-        return rep_str
+        return "\n".join(
+            [
+                f"Collection: {self['umm']['CollectionReference']}",
+                f"Spatial coverage: {self['umm']['SpatialExtent']}",
+                f"Temporal coverage: {self['umm']['TemporalExtent']}",
+                f"Size(MB): {self['size']}",
+                f"Data: {self.data_links()}",
+            ]
+        )
 
     def _repr_html_(self) -> str:
         """
         Returns:
             A rich representation for a data granule if we are in a Jupyter notebook.
         """
+        # Only needed in notebooks, so the CSS loading machinery is imported lazily
+        from .formatters import _repr_granule_html
+
         granule_html_repr = _repr_granule_html(self)
         return granule_html_repr
 
@@ -247,38 +290,31 @@ class DataGranule(CustomDict):
         Returns:
             The total size for the granule in MB.
         """
-        try:
-            data_granule = self["umm"]["DataGranule"]
-            total_size = sum(
-                [
-                    float(s["Size"])
-                    for s in data_granule["ArchiveAndDistributionInformation"]
-                    if "ArchiveAndDistributionInformation" in data_granule
-                ]
-            )
-        except Exception:
-            try:
-                data_granule = self["umm"]["DataGranule"]
-                total_size = sum(
-                    [
-                        float(s["SizeInBytes"])
-                        for s in data_granule["ArchiveAndDistributionInformation"]
-                        if "ArchiveAndDistributionInformation" in data_granule
-                    ]
-                ) / (1024 * 1024)
-            except Exception:
-                total_size = 0
-        return total_size
+        if self._size_mb is None:
+            data_granule = (self.get("umm") or {}).get("DataGranule") or {}
+            total_size = 0.0
+            for s in data_granule.get("ArchiveAndDistributionInformation") or ():
+                # entries with a missing or malformed size are counted as 0
+                try:
+                    total_size += float(s["Size"])
+                    continue
+                except (KeyError, TypeError, ValueError):
+                    pass
+                try:
+                    total_size += float(s["SizeInBytes"]) / (1024 * 1024)
+                except (KeyError, TypeError, ValueError):
+                    pass
+            self._size_mb = total_size
+        return self._size_mb
 
     def _derive_s3_link(self, links: List[str]) -> List[str]:
         s3_links = []
         for link in links:
-            if link.startswith("s3"):
-                s3_links.append(link)
-            elif link.startswith("https://") and (
-                "cumulus" in link or "protected" in link
-            ):
-                s3_links.append(f's3://{links[0].split("nasa.gov/")[1]}')
+            match = _S3_LINK.match(link)
+            if match is None:
+                continue
+            path = match.group("path")
+            s3_links.append(link if path is None else f"s3://{path}")
         return s3_links
 
     def data_links(
@@ -1,10 +1,13 @@
 import datetime as dt
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from inspect import getmembers, ismethod
 
 import dateutil.parser as parser
 import requests
 from typing_extensions import (
     Any,
+    Dict,
     List,
     Optional,
     Self,
@@ -25,6 +28,59 @@ from .results import DataCollection, DataGranule
 FloatLike: TypeAlias = Union[str, SupportsFloat]
 PointLike: TypeAlias = Tuple[FloatLike, FloatLike]
 
+# Fills in the components missing from partial dates, e.g. "2020" or "2020-02"
+_DEFAULT_DATE = dt.datetime(1979, 1, 1)
+
+_SPATIAL_KEYS = frozenset(["point", "polygon", "bounding_box", "line"])
+_COLLECTION_KEYS = frozenset(["short_name", "entry_title", "concept_id"])
+
+
+def _parse_date(date: str) -> str:
+    """Parse a date string into the ISO 8601 datetime format used by CMR.
+
+    Complete ISO 8601 dates, the common case, are parsed by `fromisoformat`; any
+    other format (e.g. "2020", "2020-02" or "Feb 1 2020") falls back to the much
+    slower `dateutil` parser.
+
+    Raises:
+        ValueError: `date` could not be parsed as a date.
+    """
+    try:
+        parsed = dt.datetime.fromisoformat(date)
+    except ValueError:
+        parsed = parser.parse(date, default=_DEFAULT_DATE)
+    return parsed.isoformat() + "Z"
+
+
+def _check_type(name: str, value: Any, expected: type) -> None:
+    """Check that a query parameter value has the expected type.
+
+    Raises:
+        TypeError: `value` is not of type `expected`.
+    """
+    if not isinstance(value, expected):
+        raise TypeError(f"{name} must be of type {expected.__name__}")
+
+
+_thread_local = threading.local()
+
+
+def _get_anonymous_session() -> requests.Session:
+    """Returns the session shared by the unauthenticated CMR queries of this thread.
+
+    Reusing a session keeps the connections to CMR alive across queries and
+    pages, instead of paying a new TCP and TLS handshake for every query. The
+    session is scoped per thread, because `requests.Session` is not guaranteed
+    to be thread-safe, and so cookies set by CMR are only shared by queries
+    created in the same thread. `get_results` prefetches pages in a worker
+    thread with the query's session, but never issues two requests at once.
+    """
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        _thread_local.session = session
+    return session
+
 
 def get_results(
     session: requests.Session,
@@ -40,6 +96,9 @@ def get_results(
         either the limit has been reached or there are no more results.
 
     Parameters:
+        session: The session used for every page request. Reuse the same session
+            across queries so the connection to CMR is kept alive.
+        query: The CMR query to get the results for
         limit: The number of results to return
 
     Returns:
@@ -53,25 +112,48 @@ def get_results(
     url = query._build_url()
 
     results: List[Any] = []
-    more_results = True
     headers = dict(query.headers or {})
 
-    while more_results:
-        response = session.get(url, headers=headers, params={"page_size": page_size})
+    def get_page(headers: Dict[str, str]) -> requests.Response:
+        return session.get(url, headers=headers, params={"page_size": page_size})
 
-        if cmr_search_after := response.headers.get("cmr-search-after"):
-            headers["cmr-search-after"] = cmr_search_after
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        response = get_page(headers)
 
-        try:
-            response.raise_for_status()
-        except requests.exceptions.HTTPError as ex:
-            raise RuntimeError(ex.response.text) from ex
+        while True:
+            if cmr_search_after := response.headers.get("cmr-search-after"):
+                headers["cmr-search-after"] = cmr_search_after
+
+            try:
+                response.raise_for_status()
+            except requests.exceptions.HTTPError as ex:
+                raise RuntimeError(ex.response.text) from ex
+
+            # When CMR reports enough hits for this page to be full and more results
+            # are needed, fetch the next page while the current one is parsed.
+            next_page: Optional[Future[requests.Response]] = None
+            hits = response.headers.get("CMR-Hits")
+            if hits is not None and len(results) + page_size < min(int(hits), limit):
+                next_page = executor.submit(get_page, dict(headers))
 
-        latest = response.json()["items"]
+            latest = response.json()["items"]
 
-        results.extend(latest)
+            results.extend(latest)
 
-        more_results = page_size <= len(latest) and len(results) < limit
+            # CMR-Hits can be stale (e.g. granules deleted while paging), so the page
+            # contents decide when to stop; a prefetched page is then dropped.
+            if len(latest) < page_size or len(results) >= limit:
+                break
+
+            if next_page is not None:
+                response = next_page.result()
+            else:
+                response = get_page(headers)
+    finally:
+        # Cancel a prefetch that has not started yet and wait for one that has, so
+        # the session is idle again when we return.
+        executor.shutdown(wait=True, cancel_futures=True)
 
     return results
 
@@ -100,7 +182,7 @@ class DataCollections(CollectionQuery):
             # To search, we need the new bearer tokens from NASA Earthdata
             auth.get_session(bearer_token=True)
             if auth is not None and auth.authenticated
-            else requests.session()
+            else _get_anonymous_session()
         )
 
         self._debug = False
@@ -197,6 +279,16 @@ class DataCollections(CollectionQuery):
         """
         return super().keyword(text)
 
+    def _set_typed_param(self, name: str, value: Any, expected: type) -> Self:
+        """Set a query parameter after checking that its value has the expected type.
+
+        Raises:
+            TypeError: `value` is not of type `expected`.
+        """
+        _check_type(name, value, expected)
+        self.params[name] = value
+        return self
+
     def doi(self, doi: str) -> Self:
         """Search datasets by DOI.
 
@@ -214,11 +306,7 @@ class DataCollections(CollectionQuery):
         Raises:
             TypeError: `doi` is not of type `str`.
         """
-        if not isinstance(doi, str):
-            raise TypeError("doi must be of type str")
-
-        self.params["doi"] = doi
-        return self
+        return self._set_typed_param("doi", doi, str)
 
     def instrument(self, instrument: str) -> Self:
         """Searh datasets by instrument.
@@ -236,11 +324,7 @@ class DataCollections(CollectionQuery):
         Raises:
             TypeError: `instrument` is not of type `str`.
         """
-        if not isinstance(instrument, str):
-            raise TypeError("instrument must be of type str")
-
-        self.params["instrument"] = instrument
-        return self
+        return self._set_typed_param("instrument", instrument, str)
 
     def project(self, project: str) -> Self:
         """Searh datasets by associated project.
@@ -259,11 +343,7 @@ class DataCollections(CollectionQuery):
         Raises:
             TypeError: `project` is not of type `str`.
         """
-        if not isinstance(project, str):
-            raise TypeError("project must be of type str")
-
-        self.params["project"] = project
-        return self
+        return self._set_typed_param("project", project, str)
 
     @override
     def parameters(self, **kwargs: Any) -> Self:
@@ -351,10 +431,7 @@ class DataCollections(CollectionQuery):
         Raises:
             TypeError: `cloud_hosted` is not of type `bool`.
         """
-        if not isinstance(cloud_hosted, bool):
-            raise TypeError("cloud_hosted must be of type bool")
-
-        self.params["cloud_hosted"] = cloud_hosted
+        self._set_typed_param("cloud_hosted", cloud_hosted, bool)
         if hasattr(self, "DAAC"):
             provider = find_provider(self.DAAC, cloud_hosted)
             self.params["provider"] = provider
@@ -432,17 +509,16 @@ class DataCollections(CollectionQuery):
                 object; or `date_from` and `date_to` are both datetime objects (or
                 parsable as such) and `date_from` is after `date_to`.
         """
-        DEFAULT = dt.datetime(1979, 1, 1)
         if date_from is not None and not isinstance(date_from, dt.datetime):
             try:
-                date_from = parser.parse(date_from, default=DEFAULT).isoformat() + "Z"
+                date_from = _parse_date(date_from)
             except Exception:
                 print("The provided start date was not recognized")
                 date_from = ""
 
         if date_to is not None and not isinstance(date_to, dt.datetime):
             try:
-                date_to = parser.parse(date_to, default=DEFAULT).isoformat() + "Z"
+                date_to = _parse_date(date_to)
             except Exception:
                 print("The provided end date was not recognized")
                 date_to = ""
@@ -466,7 +542,7 @@ class DataGranules(GranuleQuery):
             # To search, we need the new bearer tokens from NASA Earthdata
             auth.get_session(bearer_token=True)
             if auth is not None and auth.authenticated
-            else requests.session()
+            else _get_anonymous_session()
         )
 
         self._debug = False
@@ -646,8 +722,7 @@ class DataGranules(GranuleQuery):
         Raises:
             TypeError: `cloud_hosted` is not of type `bool`.
         """
-        if not isinstance(cloud_hosted, bool):
-            raise TypeError("cloud_hosted must be of type bool")
+        _check_type("cloud_hosted", cloud_hosted, bool)
 
         if "short_name" in self.params:
             provider = find_provider_by_shortname(
@@ -768,11 +843,8 @@ class DataGranules(GranuleQuery):
 
     def _valid_state(self) -> bool:
         # spatial params must be paired with a collection limiting parameter
-        spatial_keys = ["point", "polygon", "bounding_box", "line"]
-        collection_keys = ["short_name", "entry_title", "concept_id"]
-
-        if any(key in self.params for key in spatial_keys):
-            if not any(key in self.params for key in collection_keys):
+        if not _SPATIAL_KEYS.isdisjoint(self.params):
+            if _COLLECTION_KEYS.isdisjoint(self.params):
                 return False
 
         # all good then
@@ -841,17 +913,16 @@ class DataGranules(GranuleQuery):
                 object; or `date_from` and `date_to` are both datetime objects (or
                 parsable as such) and `date_from` is after `date_to`.
         """
-        DEFAULT = dt.datetime(1979, 1, 1)
         if date_from is not None and not isinstance(date_from, dt.datetime):
             try:
-                date_from = parser.parse(date_from, default=DEFAULT).isoformat() + "Z"
+                date_from = _parse_date(date_from)
             except Exception:
                 print("The provided start date was not recognized")
                 date_from = ""
 
         if date_to is not None and not isinstance(date_to, dt.datetime):
             try:
-                date_to = parser.parse(date_to, default=DEFAULT).isoformat() + "Z"
+                date_to = _parse_date(date_to)
             except Exception:
                 print("The provided end date was not recognized")
                 date_to = ""
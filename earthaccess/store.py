@@ -48,12 +48,16 @@ class EarthAccessFile(fsspec.spec.AbstractBufferedFile):
         """
 
 
+# HDF5/netCDF files are read in blocks, so their cache is aligned to the file size
+_CHUNKED_FILE_SUFFIXES = (".h5", ".hdf5", ".nc", ".nc4", ".hdf")
+
+
 def align_cache_settings(url: str, size_mb: float) -> Dict[str, Any]:
     """
     First pass at aligning the cache to be format aware. With more information about internal chunking (via dmr++) we 
     could use KnownPartsOfAFile to cache more intelligently.
     """
-    if any(url.endswith(ftype) for ftype in [".h5", ".hdf5", ".nc", ".nc4", ".hdf"]):
+    if url.endswith(_CHUNKED_FILE_SUFFIXES):
         # TODO: add max_block_number to cover the whole file
         chunk_size = 512 * 1024  # 512kb
         if size_mb >= 4 and size_mb < 10:
@@ -1,7 +1,14 @@
+import json
 import logging
+import pickle
+import threading
+import time
 
 import earthaccess
-from earthaccess.search import DataCollections
+import pytest
+from earthaccess.results import DataGranule
+from earthaccess.search import DataCollections, _get_anonymous_session, get_results
+from requests.structures import CaseInsensitiveDict
 from vcr.unittest import VCRTestCase  # type: ignore[import-untyped]
 
 logging.basicConfig()
@@ -160,3 +167,210 @@ class TestResults(VCRTestCase):
             # Verify that Search After was used in all requests except first
             self.assertEqual(first_request, "CMR-Search-After" not in request.headers)
             first_request = False
+
+
+def test_derive_s3_link():
+    granule = DataGranule({"umm": {}})
+    links = [
+        "s3://podaac-ops-cumulus-protected/MUR/granule_1.nc",
+        "https://archive.podaac.earthdata.nasa.gov/podaac-ops-cumulus-protected/MUR/granule_2.nc",
+        "https://e4ftl01.cr.usgs.gov/MOLT/granule_3.hdf",
+    ]
+    assert granule._derive_s3_link(links) == [
+        "s3://podaac-ops-cumulus-protected/MUR/granule_1.nc",
+        "s3://podaac-ops-cumulus-protected/MUR/granule_2.nc",
+    ]
+
+
+def test_granule_size():
+    umm = {
+        "DataGranule": {
+            "ArchiveAndDistributionInformation": [
+                {"Size": 1.5},
+                {"SizeInBytes": 1024 * 1024},
+            ],
+        },
+    }
+    granule = DataGranule({"umm": umm})
+    assert granule.size() == 2.5
+    assert granule["size"] == 2.5
+    assert DataGranule({"umm": {}}).size() == 0
+
+
+@pytest.mark.parametrize(
+    "data_granule, expected",
+    [
+        (None, 0),
+        ({"ArchiveAndDistributionInformation": None}, 0),
+        ({"ArchiveAndDistributionInformation": [{"Size": None}]}, 0),
+        ({"ArchiveAndDistributionInformation": [{"Size": "n/a"}]}, 0),
+        ({"ArchiveAndDistributionInformation": [{"SizeInBytes": None}]}, 0),
+        ({"ArchiveAndDistributionInformation": [None]}, 0),
+        (
+            {
+                "ArchiveAndDistributionInformation": [
+                    {"Size": None, "SizeInBytes": 1024 * 1024},
+                    {"Size": "n/a", "SizeInBytes": 1024 * 1024},
+                ]
+            },
+            2.0,
+        ),
+    ],
+)
+def test_granule_size_with_bad_metadata(data_granule, expected):
+    assert DataGranule({"umm": {"DataGranule": data_granule}}).size() == expected
+
+
+def test_granule_size_skips_bad_entries():
+    umm = {
+        "DataGranule": {
+            "ArchiveAndDistributionInformation": [{"Size": "n/a"}, {"Size": 2.0}],
+        },
+    }
+    assert DataGranule({"umm": umm}).size() == 2.0
+
+
+def test_filter_fields_keeps_requested_order():
+    granule = DataGranule(
+        {
+            "meta": {"provider-id": "P", "concept-id": "G1", "revision-id": 1},
+            "umm": {"GranuleUR": "g", "RelatedUrls": [], "TemporalExtent": {}},
+        },
+        fields=["TemporalExtent", "GranuleUR", "Missing"],
+    )
+    assert list(granule.render_dict["umm"]) == ["TemporalExtent", "GranuleUR"]
+    assert list(granule.render_dict["meta"]) == ["concept-id", "provider-id"]
+
+
+def test_dumps_orjson_and_json_agree(monkeypatch):
+    pytest.importorskip("orjson")
+    from earthaccess import results
+
+    obj = {
+        "umm": {"ShortName": "Zürich — 北京", "Values": [1, 2.5, None, True]},
+        "meta": {"concept-id": "C1", "tags": {}, "links": []},
+    }
+    with_orjson = results._dumps(obj)
+    monkeypatch.setattr(results, "orjson", None)
+    with_json = results._dumps(obj)
+    assert with_json == json.dumps(obj, indent=2)
+    assert json.loads(with_orjson) == json.loads(with_json)
+
+
+def test_granule_pickle_roundtrip():
+    umm = {
+        "RelatedUrls": [{"URL": "https://example.nasa.gov/a.nc", "Type": "GET DATA"}]
+    }
+    granule = DataGranule({"umm": umm}, cloud_hosted=True)
+    restored = pickle.loads(pickle.dumps(granule))
+    assert restored == granule
+    assert restored.cloud_hosted
+    assert restored.uuid == granule.uuid
+    assert restored.data_links() == ["https://example.nasa.gov/a.nc"]
+
+
+class StubResponse:
+    def __init__(self, items, hits, session=None, index=0):
+        self.items = items
+        self.headers = CaseInsensitiveDict({"cmr-search-after": "token"})
+        if hits is not None:
+            self.headers["CMR-Hits"] = str(hits)
+        self.session = session
+        self.index = index
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        if self.session is not None:
+            # hold the page until the prefetch of the next one has started
+            with self.session.condition:
+                self.session.condition.wait_for(
+                    lambda: self.session.requests > self.index
+                )
+        return {"items": self.items}
+
+
+class StubSession:
+    """Serves the given page sizes in order, then empty pages.
+
+    With `delay`, each request takes that long, and every page waits for the
+    prefetch of the next page to start before it is parsed.
+    """
+
+    def __init__(self, page_sizes, hits, delay=0):
+        self.page_sizes = list(page_sizes)
+        self.hits = hits
+        self.delay = delay
+        self.requests = 0
+        self.active = 0
+        self.max_active = 0
+        self.condition = threading.Condition()
+
+    def get(self, url, headers, params):
+        with self.condition:
+            size = self.page_sizes[0] if self.page_sizes else 0
+            self.page_sizes = self.page_sizes[1:]
+            self.requests += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            index = self.requests
+            self.condition.notify_all()
+        time.sleep(self.delay)
+        with self.condition:
+            self.active -= 1
+        session = self if self.delay else None
+        return StubResponse([{}] * size, self.hits, session, index)
+
+
+class StubQuery:
+    headers = None
+
+    def _build_url(self):
+        return "https://cmr.earthdata.nasa.gov/search/granules.umm_json"
+
+
+@pytest.mark.parametrize("hits", [4500, None])
+def test_get_results_stops_on_short_page(hits):
+    session = StubSession([2000, 2000, 500], hits)
+    results = get_results(session, StubQuery(), limit=10000)
+    assert len(results) == 4500
+    assert session.requests == 3
+
+
+@pytest.mark.parametrize("hits", [2000, None])
+def test_get_results_stops_on_empty_page(hits):
+    session = StubSession([2000], hits)
+    results = get_results(session, StubQuery(), limit=10000)
+    assert len(results) == 2000
+    assert session.requests == 2
+
+
+def test_get_results_stops_with_stale_hits():
+    # CMR-Hits claims more results than the pages actually contain
+    session = StubSession([2000], 6000, delay=0.05)
+    results = get_results(session, StubQuery(), limit=10000)
+    assert len(results) == 2000
+    # the empty page ends the search and the page prefetched with it is dropped
+    assert session.requests == 3
+    # the dropped prefetch has finished, so the session is idle again
+    assert session.active == 0
+    assert session.max_active == 1
+
+
+def test_get_results_stops_at_limit():
+    session = StubSession([2000, 2000, 2000], 6000)
+    results = get_results(session, StubQuery(), limit=3000)
+    assert len(results) == 4000
+    assert session.requests == 2
+
+
+def test_anonymous_session_is_scoped_per_thread():
+    session = _get_anonymous_session()
+    assert _get_anonymous_session() is session
+
+    sessions = []
+    thread = threading.Thread(target=lambda: sessions.append(_get_anonymous_session()))
+    thread.start()
+    thread.join()
+    assert sessions[0] is not session